@@ -7,6 +7,10 @@ Example:
 """
 import http.client as client
 import json
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from os import path
 
 
@@ -25,16 +29,32 @@ class Client:
         port (str): port of the Jupyter or Python interface
         suffix (str): specify version. For e.g v2
     """
+    # number of times a rate-limited or failing request is retried
+    maxRetries = 3
+    # seconds before a connect or read on the socket gives up
+    timeout = 60
+
     def __init__(
         self, url="cgjobsup.cigi.illinois.edu",
             port=443, protocol="HTTPS", suffix="v2"):
         self.url = url + ':' + str(port)
         self.protocol = protocol
         self.suffix = suffix
+        # kept open across requests so polling loops reuse one
+        # TCP+TLS connection instead of handshaking per call;
+        # per-thread because http.client connections are not thread-safe
+        self._local = threading.local()
 
     def request(self, method, uri, body={}):
         """
-        Returns data from a request made to the specified uri
+        Returns data from a request made to the specified uri.
+        Requests rejected with HTTP 429 are retried after waiting
+        the server-provided Retry-After. GET requests failing on a
+        stale keep-alive connection or with a 5xx status are also
+        retried (with an exponentially growing wait for the latter);
+        other methods are never re-sent once they may have reached
+        the server, since replaying e.g. a job submission could
+        run it twice.
 
         Args:
             methods (str): type of request that needs to be
@@ -45,16 +65,35 @@ class Client:
         Returns:
             JSON: output thats returned by the server
         """
-        if self.protocol == 'HTTP':
-            connection = client.HTTPConnection(self.url)
-        else:
-            connection = client.HTTPSConnection(self.url)
-        headers = {'Content-type': 'application/json'}
-        connection.request(
-            method, '/' + path.join(self.suffix.strip('/'), uri.strip('/')),
-            json.dumps(body), headers)
-        response = connection.getresponse()
-        out = response.read().decode()
+        for attempt in range(self.maxRetries + 1):
+            reused = getattr(self._local, 'connection', None) is not None
+            connection = self._get_connection()
+            headers = {'Content-type': 'application/json'}
+            try:
+                connection.request(
+                    method, '/' + path.join(self.suffix.strip('/'), uri.strip('/')),
+                    json.dumps(body), headers)
+                response = connection.getresponse()
+                out = response.read().decode()
+            except (client.HTTPException, OSError):
+                # a reused keep-alive connection may have gone stale;
+                # reconnect and retry once before giving up, but only
+                # for idempotent GETs — anything else may already have
+                # reached the server
+                self._drop_connection()
+                if method == 'GET' and reused and attempt < self.maxRetries:
+                    continue
+                raise
+            if response.will_close:
+                self._drop_connection()
+            if attempt < self.maxRetries:
+                if response.status == 429:
+                    time.sleep(self._retry_after_seconds(response))
+                    continue
+                if method == 'GET' and response.status >= 500:
+                    time.sleep(min(2 ** attempt, 60))
+                    continue
+            break
         try:
             data = json.loads(out)
         except:
@@ -67,3 +106,54 @@ class Client:
             raise Exception('server ' + self.url + uri + ' responded with error "' + data['error'] + msg + '"')
 
         return data
+
+    def _get_connection(self):
+        """
+        Returns this thread's keep-alive connection, opening it on
+        first use
+
+        Returns:
+            obj: HTTPConnection or HTTPSConnection to the server
+        """
+        if getattr(self._local, 'connection', None) is None:
+            if self.protocol == 'HTTP':
+                self._local.connection = client.HTTPConnection(
+                    self.url, timeout=self.timeout)
+            else:
+                self._local.connection = client.HTTPSConnection(
+                    self.url, timeout=self.timeout)
+        return self._local.connection
+
+    def _drop_connection(self):
+        """
+        Closes this thread's connection so the next request reconnects
+        """
+        if getattr(self._local, 'connection', None) is not None:
+            self._local.connection.close()
+            self._local.connection = None
+
+    def _retry_after_seconds(self, response, default=1, maximum=60):
+        """
+        Parses the Retry-After header of a rate-limited response
+
+        Args:
+            response (obj): HTTPResponse returned by the server
+            default (int): seconds to wait when the header is
+                missing or malformed
+            maximum (int): upper bound on the returned wait
+
+        Returns:
+            float: number of seconds to wait before retrying
+        """
+        retryAfter = response.getheader('Retry-After')
+        if retryAfter is None:
+            return default
+        try:
+            seconds = float(retryAfter)
+        except ValueError:
+            try:
+                date = parsedate_to_datetime(retryAfter)
+                seconds = (date - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                return default
+        return max(0, min(seconds, maximum))
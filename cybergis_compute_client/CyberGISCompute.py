@@ -14,7 +14,6 @@ from .MarkdownTable import MarkdownTable  # noqa
 import json
 import base64
 import os
-import getpass
 from IPython.display import display, Markdown, Javascript
 
 
@@ -136,6 +135,7 @@ class CyberGISCompute:
         Asks for token and host from user and calls login_token function.
         """
         if self.isJupyter:
+            import getpass
             print('📢 Please go to Control Panel -> Token, request a new API token')
             token = getpass.getpass('Enter your API token here')
             try:
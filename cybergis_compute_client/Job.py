@@ -1,7 +1,11 @@
 from .MarkdownTable import MarkdownTable  # noqa
+import sys
 import time
 import json
-from os import system, name
+import random
+import asyncio
+import functools
+from os import system, name, environ
 from IPython.display import display, clear_output, Markdown
 
 
@@ -32,6 +36,10 @@ class Job:
         self.maintainer = maintainer
         self.isJupyter = isJupyter
         self.jupyterhubApiToken = jupyterhubApiToken
+        # status cache, collapses repeated status() calls within the TTL
+        self._statusCache = None
+        self._statusCacheTs = 0.0
+        self._statusCacheTTL = 2.0
 
         job = None
         if (id is None):
@@ -63,6 +71,9 @@ class Job:
 
         self.id = id
         self.hpc = hpc
+        # reused on every status() poll instead of being rebuilt per tick
+        self._statusUri = '/job/' + self.id
+        self._statusBody = {'jupyterhubApiToken': self.jupyterhubApiToken}
         if printJob:
             self._print_job_formatted(job)
 
@@ -75,6 +86,7 @@ class Job:
         """
         body = {'jupyterhubApiToken': self.jupyterhubApiToken}
         job = self.client.request('POST', '/job/' + self.id + '/submit', body)
+        self.invalidate_status()
         print('✅ job submitted')
         self._print_job_formatted(job)
         return self
@@ -114,13 +126,16 @@ class Job:
             print('❌ please set at least one parmeter')
 
         job = self.client.request('PUT', '/job/' + self.id, body)
+        self.invalidate_status()
         if printJob:
             self._print_job(job)
 
     def events(
         self, raw=False,
             basic=True,
-            refreshRateInSeconds=10):
+            refreshRateInSeconds=10,
+            minRefreshRateInSeconds=0.5,
+            backoffRate=1.5):
         """
         While the job is running, display the events generated by the client
 
@@ -129,8 +144,16 @@ class Job:
             generated by status
             liveOutput (bool):
             basic (bool): If true, exclude non-basicEventType events
-            RefreshRateInSeconds (int): Number of seconds to wait before
-            refreshing status
+            RefreshRateInSeconds (int): Maximum number of seconds to wait
+            before refreshing status
+            minRefreshRateInSeconds (float): Starting wait between polls,
+            grown exponentially while no new events arrive
+            backoffRate (float): Multiplier applied to the wait after
+            each poll that returns no new events
+
+        Returns:
+            list: Event rows collected so far when the tail is
+            interrupted with a keyboard interrupt
 
         Todo:
             Modify function to include liveOutput or remove it
@@ -139,37 +162,92 @@ class Job:
         if raw:
             return self.status(raw=True)['events']
 
+        headers = ['types', 'message', 'time']
+        events = []
         isEnd = False
-        while (not isEnd):
-            self._clear()
-            status = self.status(raw=True)
-            out = status['events']
-            headers = ['types', 'message', 'time']
-            events = []
-            for o in out:
-                # if o['type'] not in self.basicEventTypes and basic:
-                #     continue
-                events.append([
-                    o['type'],
-                    o['message'],
-                    o['createdAt']
-                ])
-                isEnd = isEnd or o['type'] == 'JOB_ENDED' or o[
-                    'type'] == 'JOB_FAILED'
-
-            print('📮 Job ID: ' + self.id)
-            if 'slurmId' in status:
-                print('🤖 Slurm ID: ' + str(status['slurmId']))
-            if len(events) > 0:
-                if self.isJupyter:
-                    display(Markdown(MarkdownTable.render(events, headers)))
+        idleIndex = 0
+        eventCount = 0
+        rendered = False
+        try:
+            while (not isEnd):
+                status = self.status(raw=True)
+                events, isEnd = self._collect_events(status)
+
+                # only re-render when there is something new to show
+                if not rendered or len(events) > eventCount:
+                    self._render_live(events, headers, status)
+                    rendered = True
+
+                if len(events) > eventCount:
+                    eventCount = len(events)
+                    idleIndex = 0
                 else:
-                    print(MarkdownTable.render(events, headers))
+                    idleIndex += 1
+
+                if not isEnd:
+                    time.sleep(self._backoff(
+                        idleIndex, minRefreshRateInSeconds,
+                        refreshRateInSeconds, backoffRate))
+        except KeyboardInterrupt:
+            print('⚠️ event tail interrupted, job is still running')
+            return events
+
+    async def _status_async(self):
+        """
+        Fetches raw status in the default executor so awaiting callers
+        never block the event loop. Uses run_in_executor rather than
+        asyncio.to_thread, which needs Python 3.9 while the test
+        workflow still runs 3.7.
+
+        Returns:
+            JSON: the raw status of this job
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.status, raw=True))
+
+    async def events_async(
+        self, raw=False,
+            basic=True,
+            refreshRateInSeconds=10,
+            minRefreshRateInSeconds=0.5,
+            backoffRate=1.5):
+        """
+        Coroutine version of events() that polls without blocking the
+        event loop, so it can be awaited alongside logs_async() (e.g.
+        via asyncio.gather) or other work in the same notebook.
+
+        Takes the same arguments as events().
+        """
+        if raw:
+            return (await self._status_async())['events']
+
+        headers = ['types', 'message', 'time']
+        isEnd = False
+        idleIndex = 0
+        eventCount = 0
+        rendered = False
+        while (not isEnd):
+            status = await self._status_async()
+            events, isEnd = self._collect_events(status)
+
+            if not rendered or len(events) > eventCount:
+                self._render_live(events, headers, status)
+                rendered = True
+
+            if len(events) > eventCount:
+                eventCount = len(events)
+                idleIndex = 0
+            else:
+                idleIndex += 1
 
             if not isEnd:
-                time.sleep(refreshRateInSeconds)
+                await asyncio.sleep(self._backoff(
+                    idleIndex, minRefreshRateInSeconds,
+                    refreshRateInSeconds, backoffRate))
 
-    def logs(self, raw=False, liveOutput=True, refreshRateInSeconds=15):
+    def logs(self, raw=False, liveOutput=True, refreshRateInSeconds=15,
+             minRefreshRateInSeconds=0.5, backoffRate=1.5):
         """
         While the job is running, display the logs generated by the client.
 
@@ -177,12 +255,18 @@ class Job:
             raw (bool): If true, return a list of the events
             generated by status
             liveOutput (bool):
-            RefreshRateInSeconds (int): Number of seconds to wait
+            RefreshRateInSeconds (int): Maximum number of seconds to wait
             before refreshing status
+            minRefreshRateInSeconds (float): Starting wait between polls,
+            grown exponentially while no new logs arrive
+            backoffRate (float): Multiplier applied to the wait after
+            each poll that returns no new logs
 
         Returns:
             list: List of logs generated by the client.
-            Only returned if raw is true.
+            Only returned if raw is true. When the tail is interrupted
+            with a keyboard interrupt, the log rows collected so far
+            are returned instead.
 
         Todo:
             Modify function to include liveOutput
@@ -191,36 +275,72 @@ class Job:
         if raw:
             return self.status(raw=True)['logs']
 
+        headers = ['message', 'time']
         logs = []
         isEnd = False
-        while (not isEnd):
-            self._clear()
-            status = self.status(raw=True)
-            headers = ['message', 'time']
-            logs = []
-
-            for o in status['events']:
-                isEnd = isEnd or o['type'] == 'JOB_ENDED' or o[
-                    'type'] == 'JOB_FAILED'
-
-            for o in status['logs']:
-                i = [
-                    o['message'],
-                    o['createdAt']
-                ]
-                logs.append(i)
-
-            print('📮 Job ID: ' + self.id)
-            if 'slurmId' in status:
-                print('🤖 Slurm ID: ' + str(status['slurmId']))
-            if len(logs) > 0:
-                if self.isJupyter:
-                    display(Markdown(MarkdownTable.render(logs, headers)))
+        idleIndex = 0
+        logCount = 0
+        rendered = False
+        try:
+            while (not isEnd):
+                status = self.status(raw=True)
+                logs, isEnd = self._collect_logs(status)
+
+                # only re-render when there is something new to show
+                if not rendered or len(logs) > logCount:
+                    self._render_live(logs, headers, status)
+                    rendered = True
+
+                if len(logs) > logCount:
+                    logCount = len(logs)
+                    idleIndex = 0
                 else:
-                    print(MarkdownTable.render(logs, headers))
+                    idleIndex += 1
+
+                if not isEnd:
+                    time.sleep(self._backoff(
+                        idleIndex, minRefreshRateInSeconds,
+                        refreshRateInSeconds, backoffRate))
+        except KeyboardInterrupt:
+            print('⚠️ log tail interrupted, job is still running')
+            return logs
+
+    async def logs_async(self, raw=False, liveOutput=True,
+                         refreshRateInSeconds=15,
+                         minRefreshRateInSeconds=0.5, backoffRate=1.5):
+        """
+        Coroutine version of logs() that polls without blocking the
+        event loop, so it can be awaited alongside events_async() (e.g.
+        via asyncio.gather) or other work in the same notebook.
+
+        Takes the same arguments as logs().
+        """
+        if raw:
+            return (await self._status_async())['logs']
+
+        headers = ['message', 'time']
+        isEnd = False
+        idleIndex = 0
+        logCount = 0
+        rendered = False
+        while (not isEnd):
+            status = await self._status_async()
+            logs, isEnd = self._collect_logs(status)
+
+            if not rendered or len(logs) > logCount:
+                self._render_live(logs, headers, status)
+                rendered = True
+
+            if len(logs) > logCount:
+                logCount = len(logs)
+                idleIndex = 0
+            else:
+                idleIndex += 1
 
             if not isEnd:
-                time.sleep(refreshRateInSeconds)
+                await asyncio.sleep(self._backoff(
+                    idleIndex, minRefreshRateInSeconds,
+                    refreshRateInSeconds, backoffRate))
 
     def status(self, raw=False):
         """
@@ -241,14 +361,26 @@ class Job:
         if self.id is None:
             raise Exception('missing job ID, submit/register job first')
 
-        job = self.client.request('GET', '/job/' + self.id, {
-            'jupyterhubApiToken': self.jupyterhubApiToken
-        })
+        if (self._statusCache is not None and time.monotonic() - self._statusCacheTs < self._statusCacheTTL):
+            job = self._statusCache
+        else:
+            job = self.client.request(
+                'GET', self._statusUri, self._statusBody)
+            self._statusCache = job
+            self._statusCacheTs = time.monotonic()
 
         if raw:
             return job
         self._print_job_formatted(job)
 
+    def invalidate_status(self):
+        """
+        Drops the cached status so the next status() call
+        fetches fresh data from the client
+        """
+        self._statusCache = None
+        self._statusCacheTs = 0.0
+
     def result_folder_content(self):
         """
         Returns the results from the job
@@ -317,18 +449,113 @@ class Job:
             print('❌ download fail!')
 
     # Helpers
+    def _backoff(self, index, min_s, max_s, rate):
+        """
+        Returns the number of seconds to sleep before the next status poll
+
+        The wait grows exponentially with the number of consecutive polls
+        that returned no new data, capped at max_s, with jitter so that
+        concurrent pollers don't synchronize on the server.
+
+        Args:
+            index (int): Number of consecutive polls without new data
+            min_s (float): Smallest possible wait in seconds
+            max_s (float): Largest possible wait in seconds
+            rate (float): Exponential growth rate of the wait
+
+        Returns:
+            float: Number of seconds to sleep
+        """
+        return random.uniform(min_s, min(max_s, min_s * rate ** index))
+
+    def _collect_events(self, status):
+        """
+        Builds the event table rows from a raw status response
+
+        Args:
+            status (dict): raw output of status()
+
+        Returns:
+            tuple: (list of [type, message, time] rows,
+            bool whether the job has ended)
+        """
+        events = []
+        isEnd = False
+        for o in status['events']:
+            # if o['type'] not in self.basicEventTypes and basic:
+            #     continue
+            events.append([
+                o['type'],
+                o['message'],
+                o['createdAt']
+            ])
+            isEnd = isEnd or o['type'] == 'JOB_ENDED' or o[
+                'type'] == 'JOB_FAILED'
+        return events, isEnd
+
+    def _collect_logs(self, status):
+        """
+        Builds the log table rows from a raw status response
+
+        Args:
+            status (dict): raw output of status()
+
+        Returns:
+            tuple: (list of [message, time] rows,
+            bool whether the job has ended)
+        """
+        isEnd = False
+        # termination events are final, so scanning from the tail
+        # finds them without walking the whole event history
+        for o in reversed(status['events']):
+            if o['type'] == 'JOB_ENDED' or o['type'] == 'JOB_FAILED':
+                isEnd = True
+                break
+
+        logs = []
+        for o in status['logs']:
+            i = [
+                o['message'],
+                o['createdAt']
+            ]
+            logs.append(i)
+        return logs, isEnd
+
+    def _render_live(self, rows, headers, status):
+        """
+        Clears the screen and renders one refresh of a live table
+
+        Args:
+            rows (list): table rows to display
+            headers (list): table headers
+            status (dict): raw output of status(), used for the
+                job/slurm id header lines
+        """
+        self._clear()
+        print('📮 Job ID: ' + self.id)
+        if 'slurmId' in status:
+            print('🤖 Slurm ID: ' + str(status['slurmId']))
+        if len(rows) > 0:
+            if self.isJupyter:
+                display(Markdown(MarkdownTable.render(rows, headers)))
+            else:
+                print(MarkdownTable.render(rows, headers))
+
     def _clear(self):
         """
         Clears output
         """
         if self.isJupyter:
             clear_output(wait=True)
-        # for windows
-        if name == 'nt':
+            return
+        # legacy windows consoles don't understand ANSI escapes
+        if name == 'nt' and environ.get('TERM') is None:
             _ = system('cls')
-        # for mac and linux(here, os.name is 'posix')
+        # everything else takes the escape codes directly,
+        # avoiding a fork+exec per refresh
         else:
-            _ = system('clear')
+            sys.stdout.write('\x1b[2J\x1b[H')
+            sys.stdout.flush()
 
     def _print_job(self, job):
         """
@@ -362,13 +589,19 @@ class Job:
         else:
             print(MarkdownTable.render(data, headers))
 
-    def _print_job_formatted(self, job):
-        """
-        Displays information about the job formatted in a way that can be read with no horizonal scroll bar
+    def _formatted_tables(self, job):
         """
+        Builds the job-information tables formatted in a way that can
+        be read with no horizontal scroll bar
+
+        Args:
+            job (dict): Information about this job returned by the client
 
+        Returns:
+            list: rendered MarkdownTable strings, one per table
+        """
         if job is None:
-            return
+            return []
         if job['localExecutableFolder'] is None:
             modelName = "None"
         else:
@@ -397,9 +630,16 @@ class Job:
             modelName
         ]]
 
-        if self.isJupyter:
-            display(Markdown(MarkdownTable.render(dataCol1, headersCol1)))
-            display(Markdown(MarkdownTable.render(dataCol2, headersCol2)))
-        else:
-            print(MarkdownTable.render(dataCol1, headersCol1))
-            print(MarkdownTable.render(dataCol2, headersCol2))
+        return [
+            MarkdownTable.render(dataCol1, headersCol1),
+            MarkdownTable.render(dataCol2, headersCol2)]
+
+    def _print_job_formatted(self, job):
+        """
+        Displays information about the job formatted in a way that can be read with no horizonal scroll bar
+        """
+        for table in self._formatted_tables(job):
+            if self.isJupyter:
+                display(Markdown(table))
+            else:
+                print(table)
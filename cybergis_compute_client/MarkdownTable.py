@@ -3,15 +3,12 @@ class MarkdownTable:
     def render(data, headers):
         if len(headers) == 0:
             return ''
-        output = '| '
-        headerDivider = '| '
-        for header in headers:
-            output += header + ' | '
-            headerDivider += '--- | '
-        output += '\n' + headerDivider
+        parts = [
+            '| ' + ''.join(header + ' | ' for header in headers),
+            '| ' + '--- | ' * len(headers)
+        ]
         for row in data:
-            rowData = '| '
-            for col in row:
-                rowData += str(col).replace('|', '<code>&#124;</code>') + ' | '
-            output += '\n' + rowData
-        return output
+            parts.append('| ' + ''.join(
+                str(col).replace('|', '<code>&#124;</code>') + ' | '
+                for col in row))
+        return '\n'.join(parts)
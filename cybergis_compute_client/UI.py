@@ -1,11 +1,27 @@
 import os
 import math
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import ipywidgets as widgets
-from ipyfilechooser import FileChooser
-from IPython.display import Markdown, display, clear_output
+from IPython.display import Markdown, display
 from .MarkdownTable import MarkdownTable  # noqa
 
 
+class _NameSafeTable(dict):
+    """
+    str.translate table that deletes everything except alphanumerics,
+    '.' and '_'. Entries are classified lazily on first sight of each
+    codepoint, so the table only ever holds characters that actually
+    appear in user-supplied names.
+    """
+    def __missing__(self, code):
+        char = chr(code)
+        result = code if (char.isalnum() or char in '._') else None
+        self[code] = result
+        return result
+
+
 class UI:
     """
     UI class.
@@ -39,10 +55,20 @@ class UI:
         jupyter_globus (dict): Information about where the output data will be
             stored (container_home_path, endpoint, root_path)
     """
+    # shared by every widget the UI builds; a single Layout model is
+    # safe to share by reference and avoids re-syncing the same style
+    # and layout state once per widget
+    STYLE = {'description_width': 'auto'}
+    LAYOUT_60 = widgets.Layout(width='60%')
+    # everything that is not a (Unicode) letter, digit, underscore or
+    # dot gets stripped out of user-supplied names; shared across
+    # instances so classifications accumulate for the session
+    _SAFE_TABLE = _NameSafeTable()
+
     def __init__(self, compute, defaultJobName="hello_world", defaultDataFolder="./", defaultRemoteResultFolder=None):
         self.compute = compute
-        self.style = {'description_width': 'auto'}
-        self.layout = widgets.Layout(width='60%')
+        self.style = UI.STYLE
+        self.layout = UI.LAYOUT_60
         self.jobs = None
         self.hpcs = None
         self.defaultJobName = defaultJobName
@@ -66,8 +92,58 @@ class UI:
             'cpu_per_task', 'num_of_node', 'num_of_task', 'gpus',
             'gpus_per_node', 'gpus_per_socket', 'gpus_per_task']
         self.slurm_string_option_configs = ['partition']
+        # frozenset mirrors of the category lists above, for O(1)
+        # membership tests inside the render and get_data loops
+        self._slurm_integer_configs = frozenset(self.slurm_integer_configs)
+        self._slurm_integer_storage_unit_config = frozenset(
+            self.slurm_integer_storage_unit_config)
+        self._slurm_integer_time_unit_config = frozenset(
+            self.slurm_integer_time_unit_config)
+        self._slurm_integer_none_unit_config = frozenset(
+            self.slurm_integer_none_unit_config)
+        self._slurm_string_option_configs = frozenset(
+            self.slurm_string_option_configs)
         self.globus_filename = None
         self.jupyter_globus = None
+        # runs fetches that should not block the render critical path
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._announcementsFuture = None
+        # widgets are reused across re-renders when their config
+        # signature is unchanged, skipping the comm open/close cost
+        # of rebuilding identical controls
+        self._slurmWidgetCache = {}
+        self._paramWidgetCache = {}
+        # (jobName, hpcName) the slurm/param accordions were last
+        # built for; a matching signature redisplays them as-is
+        self._slurmSignature = None
+        self._paramSignature = None
+        # (timestamp, contents) of the last result_folder_content()
+        # fetch, so the download panel rerender does not repeat the
+        # HPC round trip
+        self._resultFolderCache = None
+        self._resultFolderCacheTTL = 30.0
+        # (timestamp, jobs, hpcs) from list_git/list_hpc; the catalogs
+        # change rarely but init() refetched them on every render
+        self._catalogCache = None
+        self._catalogCacheTTL = 300.0
+        # background tails of the running job's logs and events; each
+        # pump remembers which job it tails and carries a stop flag so
+        # submitting a new job can retire the old pump
+        self._logPumpThread = None
+        self._logPumpJobId = None
+        self._logPumpStop = None
+        self._eventPumpThread = None
+        self._eventPumpJobId = None
+        self._eventPumpStop = None
+        # in-flight submission, run off the main comm thread
+        self._submitThread = None
+        # trailing debounce for pagination/load-more handlers: click
+        # messages are processed serially on the comm thread, so a
+        # double-click's second message runs right after the first
+        # handler returns; clicks landing within this window of the
+        # last handled one are dropped instead of refetching
+        self._paginationTs = 0.0
+        self._paginationDebounce = 0.15
 
     def render(self):
         """
@@ -86,22 +162,25 @@ class UI:
             display(divider)
             display(Markdown('**Your CyberGIS-Compute Username:** ' + str(self.compute.username)))
             self.renderAnnouncements()
-            display(self.jobTemplate['output'])
-            display(self.description['output'])
-            display(self.computingResource['output'])
-            display(self.slurm['output'])
-            display(self.param['output'])
-            display(self.uploadData['output'])
-            display(self.email['output'])
-            display(self.name['output'])
-            display(self.submit['output'])
-            display(self.submitNew['output'])
+            # one VBox display instead of a comm message per section
+            display(widgets.VBox(children=(
+                self.jobTemplate['output'],
+                self.description['output'],
+                self.computingResource['output'],
+                self.slurm['output'],
+                self.param['output'],
+                self.uploadData['output'],
+                self.email['output'],
+                self.name['output'],
+                self.submit['output'],
+                self.submitNew['output'])))
 
         # 2. job status
         job_status = widgets.Output()
         with job_status:
-            display(self.resultStatus['output'])
-            display(self.resultCancel['output'])
+            display(widgets.VBox(children=(
+                self.resultStatus['output'],
+                self.resultCancel['output'])))
             display(divider)
             display(Markdown('## 📋 job events (live refresh)'))
             display(self.resultEvents['output'])
@@ -117,8 +196,9 @@ class UI:
         # 4. your jobs
         job_refresh = widgets.Output()
         with job_refresh:
-            display(self.recently_submitted['output'])
-            display(self.load_more['output'])
+            display(widgets.VBox(children=(
+                self.recently_submitted['output'],
+                self.load_more['output'])))
 
         # 5. your folders
         user_folders = widgets.Output()
@@ -138,6 +218,7 @@ class UI:
         self.tab.set_title(2, 'Download Job Result')
         self.tab.set_title(3, 'Your Jobs')
         self.tab.set_title(4, 'Past Results')
+        self.tab.observe(self.onTabSelected(), names=['selected_index'])
         display(self.tab)
 
     def renderComponents(self):
@@ -153,44 +234,49 @@ class UI:
         self.renderSubmit()
         self.renderParam()
         self.renderUploadData()
-        self.renderResultStatus()
-        self.renderResultCancel()
-        self.renderResultEvents()
-        self.renderResultLogs()
-        self.renderDownload()
-        self.renderRecentlySubmittedJobs()
-        self.renderLoadMore()
         self.renderSubmitNew()
-        self.renderFolders()
+        # the other tabs render lazily on first selection
+        # (see onTabSelected)
 
     # components
     def renderAnnouncements(self):
         """
-        Displays announcements if the announcement route exists and there are any
+        Displays announcements if the announcement route exists and there
+        are any. The fetch runs on a background thread (started in init)
+        so the first paint is not blocked on a network round-trip; the
+        placeholder is filled in once the request completes.
+        """
+        output = widgets.Output()
+        display(output)
+        self._announcementsFuture.add_done_callback(
+            lambda future: self._fillAnnouncements(future, output))
+
+    def _fillAnnouncements(self, future, output):
+        """
+        Pushes the fetched announcements into the placeholder output;
+        failures (e.g. the route doesn't exist) leave it empty
         """
         try:
-            announcement = self.compute.client.request('GET', '/announcement')["announcements"]
-            if (len(announcement) > 0):
-                display(Markdown('## Announcements'))
-                for i in range(len(announcement)):
-                    display(Markdown('### Message ' + str(i + 1) + ':'))
-                    display(Markdown('Message: ' + announcement[i]["message"]))
-                    display(Markdown('Posted by: ' + announcement[i]["poster"] + " at " + announcement[i]["time_stamp"]))
-                display(Markdown("***"))
-        except:
-            pass
+            announcement = future.result()["announcements"]
+        except Exception:
+            return
+        if (len(announcement) > 0):
+            # one Markdown blob means one frontend update for the
+            # whole section instead of several per announcement
+            parts = [
+                '### Message ' + str(i + 1) + ':\n\n' + 'Message: ' + announcement[i]["message"] + '\n\n' + 'Posted by: ' + announcement[i]["poster"] + " at " + announcement[i]["time_stamp"]
+                for i in range(len(announcement))]
+            output.append_display_data(Markdown(
+                '## Announcements\n\n' + '\n\n'.join(parts) + '\n\n***'))
 
     def renderJobTemplate(self):
         """
         Display a dropdown of jobs to run.
         Update jobTemplate when the dropdown changes.
         """
-        if self.jobTemplate['output'] is None:
-
-            self.jobTemplate['output'] = widgets.Output()
         # create components
         self.jobTemplate['dropdown'] = widgets.Dropdown(
-            options=[i for i in self.jobs], value=self.jobName,
+            options=list(self.jobs), value=self.jobName,
             description='📦 Job Templates:',
             style=self.style,
             layout=self.layout)
@@ -203,28 +289,27 @@ class UI:
         Display information about the job (job name, job description,
         HPC name, HPC description, estimated runtime)
         """
-        if self.description['output'] is None:
-            self.description['output'] = widgets.Output()
 
         self.description['job_description'] = Markdown('**' + self.jobName + ' Job Description:** ' + self.job['description'])
         self.description['computing_resource_description'] = Markdown('**' + self.hpcName + ' HPC Description**: ' + self.hpc['description'])
         self.description['estimated_runtime'] = Markdown(
             '**Estimated Runtime:** ' + self.job['estimated_runtime'])
-        with self.description['output']:
-            display(
-                self.description['job_description'],
-                self.description['computing_resource_description'],
-                self.description['estimated_runtime'])
+        # append directly instead of capturing stdout through the
+        # output context manager
+        self.description['output'].append_display_data(
+            self.description['job_description'])
+        self.description['output'].append_display_data(
+            self.description['computing_resource_description'])
+        self.description['output'].append_display_data(
+            self.description['estimated_runtime'])
 
     def renderComputingResource(self):
         """
         Display computing resources in a dropdown for the user to select
         """
-        if self.computingResource['output'] is None:
-            self.computingResource['output'] = widgets.Output()
         # create components
         self.computingResource['dropdown'] = widgets.Dropdown(
-            options=[i for i in self.job['supported_hpc']],
+            options=self.job['supported_hpc'],
             value=self.hpcName,
             description='🖥 Computing Resource:',
             style=self.style,
@@ -244,16 +329,15 @@ class UI:
         Displays a checkbox that lets the user receive an email
         on job status and input their email.
         """
-        if self.email['output'] is None:
-            self.email['output'] = widgets.Output()
-        # create components
-        self.email['checkbox'] = widgets.Checkbox(
-            description='receive email on job status? ',
-            value=False, style=self.style)
-        self.email['text'] = widgets.Text(
-            placeholder='example@illinois.edu', style=self.style)
-        self.email['hbox'] = widgets.HBox(
-            [self.email['checkbox'], self.email['text']])
+        # fully static controls: build once, redisplay thereafter
+        if self.email.get('hbox') is None:
+            self.email['checkbox'] = widgets.Checkbox(
+                description='receive email on job status? ',
+                value=False, style=self.style)
+            self.email['text'] = widgets.Text(
+                placeholder='example@illinois.edu', style=self.style)
+            self.email['hbox'] = widgets.HBox(
+                [self.email['checkbox'], self.email['text']])
         with self.email['output']:
             display(self.email['hbox'])
 
@@ -262,16 +346,15 @@ class UI:
         Displays a box to toggle naming the job being submitted
         and provides a text entry for the user to input the name
         """
-        if self.name['output'] is None:
-            self.name['output'] = widgets.Output()
-        # create components
-        self.name['checkbox'] = widgets.Checkbox(
-            description='Set a name for this job? ',
-            value=False, style=self.style)
-        self.name['text'] = widgets.Text(
-            placeholder='Type job name here', style=self.style)
-        self.name['hbox'] = widgets.HBox(
-            [self.name['checkbox'], self.name['text']])
+        # fully static controls: build once, redisplay thereafter
+        if self.name.get('hbox') is None:
+            self.name['checkbox'] = widgets.Checkbox(
+                description='Set a name for this job? ',
+                value=False, style=self.style)
+            self.name['text'] = widgets.Text(
+                placeholder='Type job name here', style=self.style)
+            self.name['hbox'] = widgets.HBox(
+                [self.name['checkbox'], self.name['text']])
         with self.name['output']:
             display(Markdown("Please note that the naming feature only allows for names made up of letters, numbers, and the characters ' . ' and ' _ '. Other characters will be removed from your input."))
             display(self.name['hbox'])
@@ -281,11 +364,16 @@ class UI:
         Configures Slurm input rules (default value, min, m),
         allows the user to input custom input rules if they want.
         """
-        if self.slurm['output'] is None:
-            self.slurm['output'] = widgets.Output()
         # check if necessary to render
         if self.job['slurm_input_rules'] == {}:
             return
+        # unchanged job/HPC selection: redisplay the accordion built
+        # last time instead of rebuilding every control
+        signature = (self.jobName, self.hpcName)
+        if (signature == self._slurmSignature and self.slurm.get('accordion') is not None):
+            with self.slurm['output']:
+                display(self.slurm['accordion'])
+            return
         # create components
         self.slurm['description'] = widgets.Label(value='All configs are optional. Please refer to Slurm official documentation at 🔗 https://slurm.schedmd.com/sbatch.html')
         # settings
@@ -294,35 +382,49 @@ class UI:
                 self.slurm[i] = None
                 continue
             config = self.job['slurm_input_rules'][i]
-            if i in self.slurm_integer_configs:
+            if i in self._slurm_integer_configs:
                 default_val = config['default_value']
                 max_val = config['max']
                 min_val = config['min']
                 step_val = config['step']
                 unit = config['unit']
                 description = i + ' (' + unit + ')' if unit != 'None' else i
-                self.slurm[i] = widgets.IntSlider(
-                    value=default_val,
-                    min=min_val,
-                    max=max_val,
-                    step=step_val,
-                    disabled=False,
-                    continuous_update=False,
-                    orientation='horizontal',
-                    readout=True,
-                    readout_format='d',
-                    description=description,
-                    style=self.style, layout=self.layout
-                )
-            if i in self.slurm_string_option_configs:
+                sig = (i, 'integer', min_val, max_val, step_val, unit)
+                cached = self._slurmWidgetCache.get(sig)
+                if cached is not None:
+                    cached.value = default_val
+                    self.slurm[i] = cached
+                else:
+                    self.slurm[i] = widgets.IntSlider(
+                        value=default_val,
+                        min=min_val,
+                        max=max_val,
+                        step=step_val,
+                        disabled=False,
+                        continuous_update=False,
+                        orientation='horizontal',
+                        readout=True,
+                        readout_format='d',
+                        description=description,
+                        style=self.style, layout=self.layout
+                    )
+                    self._slurmWidgetCache[sig] = self.slurm[i]
+            if i in self._slurm_string_option_configs:
                 default_val = config['default_value']
                 options = config['options']
-                self.slurm[i] = widgets.Dropdown(
-                    options=options,
-                    value=default_val,
-                    description=i,
-                    style=self.style
-                )
+                sig = (i, 'string_option', tuple(options))
+                cached = self._slurmWidgetCache.get(sig)
+                if cached is not None:
+                    cached.value = default_val
+                    self.slurm[i] = cached
+                else:
+                    self.slurm[i] = widgets.Dropdown(
+                        options=options,
+                        value=default_val,
+                        description=i,
+                        style=self.style
+                    )
+                    self._slurmWidgetCache[sig] = self.slurm[i]
 
         w = []
         for i in self.slurm_configs:
@@ -333,6 +435,7 @@ class UI:
         # settings end
         self.slurm['accordion'] = widgets.Accordion(children=(widgets.VBox(children=(self.slurm['description'], self.slurm['vbox'])),), selected_index=None)
         self.slurm['accordion'].set_title(0, 'Slurm Computing Configurations')
+        self._slurmSignature = signature
         with self.slurm['output']:
             display(self.slurm['accordion'])
 
@@ -340,11 +443,12 @@ class UI:
         """
         Lets the user select the upload data location from a file chooser.
         """
-        if self.uploadData['output'] is None:
-            self.uploadData['output'] = widgets.Output()
         # check if necessary to render
         if not self.job['require_upload_data']:
             return
+        # imported at point of use so jobs without upload data never
+        # pay the ipyfilechooser import cost
+        from ipyfilechooser import FileChooser
         # render all
         self.uploadData['selector'] = FileChooser(
             self.defaultDataFolder,
@@ -360,11 +464,16 @@ class UI:
         """
         Displays input areas for the job parameters
         """
-        if self.param['output'] is None:
-            self.param['output'] = widgets.Output()
         # check if necessary to render
         if self.job['param_rules'] == {}:
             return
+        # unchanged job/HPC selection: redisplay the accordion built
+        # last time instead of rebuilding every control
+        signature = (self.jobName, self.hpcName)
+        if (signature == self._paramSignature and self.param.get('accordion') is not None):
+            with self.param['output']:
+                display(self.param['accordion'])
+            return
         # clear config
         for i in self.param:
             if i != 'output':
@@ -383,44 +492,66 @@ class UI:
                 min_val = config['min']
                 step_val = config['step']
                 description = i
-                self.param[i] = widgets.IntSlider(
-                    value=default_val,
-                    min=min_val,
-                    max=max_val,
-                    step=step_val,
-                    disabled=False,
-                    continuous_update=False,
-                    orientation='horizontal',
-                    readout=True,
-                    readout_format='d',
-                    description=description,
-                    style=self.style, layout=self.layout
-                )
+                sig = (i, 'integer', min_val, max_val, step_val)
+                cached = self._paramWidgetCache.get(sig)
+                if cached is not None:
+                    cached.value = default_val
+                    self.param[i] = cached
+                else:
+                    self.param[i] = widgets.IntSlider(
+                        value=default_val,
+                        min=min_val,
+                        max=max_val,
+                        step=step_val,
+                        disabled=False,
+                        continuous_update=False,
+                        orientation='horizontal',
+                        readout=True,
+                        readout_format='d',
+                        description=description,
+                        style=self.style, layout=self.layout
+                    )
+                    self._paramWidgetCache[sig] = self.param[i]
             if config['type'] == 'string_option':
                 if self.input_params is not None and i in self.input_params.keys() and self.input_params[i] in config['options']:
                     default_val = self.input_params[i]
                 else:
                     default_val = config['default_value']
                 options = config['options']
-                self.param[i] = widgets.Dropdown(
-                    options=options,
-                    value=default_val,
-                    description=i,
-                    style=self.style
-                )
+                sig = (i, 'string_option', tuple(options))
+                cached = self._paramWidgetCache.get(sig)
+                if cached is not None:
+                    cached.value = default_val
+                    self.param[i] = cached
+                else:
+                    self.param[i] = widgets.Dropdown(
+                        options=options,
+                        value=default_val,
+                        description=i,
+                        style=self.style
+                    )
+                    self._paramWidgetCache[sig] = self.param[i]
             if config['type'] == 'string_input':
                 if self.input_params is not None and i in self.input_params.keys():
                     default_val = self.input_params[i]
                 else:
                     default_val = config['default_value']
-                self.param[i] = widgets.Text(
-                    description=i, value=default_val, style=self.style)
+                sig = (i, 'string_input')
+                cached = self._paramWidgetCache.get(sig)
+                if cached is not None:
+                    cached.value = default_val
+                    self.param[i] = cached
+                else:
+                    self.param[i] = widgets.Text(
+                        description=i, value=default_val, style=self.style)
+                    self._paramWidgetCache[sig] = self.param[i]
 
         # render all
         self.param['vbox'] = widgets.VBox([self.param[i] for i in self.job['param_rules']])
         # settings end
         self.param['accordion'] = widgets.Accordion(children=(self.param['vbox'], ), selected_index=None)
         self.param['accordion'].set_title(0, 'Input Parameters')
+        self._paramSignature = signature
         with self.param['output']:
             display(self.param['accordion'])
 
@@ -429,10 +560,6 @@ class UI:
         Render submit button. If the job has been submitted,
         display that, otherwise display the submit button.
         """
-        if self.submit['output'] is None:
-            self.submit['output'] = widgets.Output()
-        if self.submit['alert_output'] is None:
-            self.submit['alert_output'] = widgets.Output()
         # create components
         if self.submitted:
             self.submit['button'] = widgets.Button(
@@ -448,8 +575,6 @@ class UI:
         """
         Render submit new button, which allows the user to return the SDK to a pre-submission state so they can submit successive jobs.
         """
-        if self.submitNew['output'] is None:
-            self.submitNew['output'] = widgets.Output()
         if self.submitted:
             self.submitNew['button'] = widgets.Button(description="Submit New Job")
         else:
@@ -468,23 +593,19 @@ class UI:
         """
         Creates the components of the download section
         """
-        if self.download['output'] is None:
-            self.download['output'] = widgets.Output()
-        if self.download['alert_output'] is None:
-            self.download['alert_output'] = widgets.Output()
-        if self.download['result_output'] is None:
-            self.download['result_output'] = widgets.Output()
         # create components
         if self.jobFinished:
-            result_folder_content = self.compute.job.result_folder_content()
-            # push default value to front
-            try:
-                result_folder_content.insert(
-                    0, result_folder_content.pop(
-                        result_folder_content.index(
-                            self.defaultRemoteResultFolder)))
-            except Exception:
-                result_folder_content
+            now = time.monotonic()
+            if (self._resultFolderCache is not None and now - self._resultFolderCache[0] < self._resultFolderCacheTTL):
+                result_folder_content = self._resultFolderCache[1]
+            else:
+                result_folder_content = self.compute.job.result_folder_content()
+                self._resultFolderCache = (now, result_folder_content)
+            # push default value to front in a single sweep
+            if self.defaultRemoteResultFolder in result_folder_content:
+                result_folder_content = [self.defaultRemoteResultFolder] + [
+                    i for i in result_folder_content
+                    if i != self.defaultRemoteResultFolder]
             if len(result_folder_content) == 0:
                 raise Exception('failed to get result folder content')
             self.download['dropdown'] = widgets.Dropdown(
@@ -510,24 +631,27 @@ class UI:
         """
         Display the status of the job.
         """
-        if self.resultStatus['output'] is None:
-            self.resultStatus['output'] = widgets.Output()
 
         if not self.submitted:
-            with self.resultStatus['output']:
-                display(Markdown('# 😴 No Job to Work On'))
-                display(Markdown('you need to submit your job first'))
+            self.resultStatus['output'].append_display_data(
+                Markdown('# 😴 No Job to Work On'))
+            self.resultStatus['output'].append_display_data(
+                Markdown('you need to submit your job first'))
             return
 
-        with self.resultStatus['output']:
-            display(Markdown('# ✌️ Your Job is Here!'))
-            self.compute.job.status()
+        # appended rather than captured so this stays safe when
+        # called from the submit thread
+        self.resultStatus['output'].append_display_data(
+            Markdown('# ✌️ Your Job is Here!'))
+        status = self.compute.job.status(raw=True)
+        for table in self.compute.job._formatted_tables(status):
+            self.resultStatus['output'].append_display_data(
+                Markdown(table))
         return
 
     def renderResultCancel(self):
-        if self.resultCancel['output'] is None:
-            self.resultCancel['output'] = widgets.Output()
-        with self.resultCancel['output']:
+        # the explanation accordion never changes: build it once
+        if self.resultCancel.get('accordion') is None:
             cancelText = """<p>1. Press the stop button in the top bar of your Jupyter notebook <b>twice</b>. Please note that errors will appear on the user interface. While your logs will stop updating, <b>your job is still running</b>.</p>
 
 <p>2. Create a new code block below the UI.</p>
@@ -535,108 +659,274 @@ class UI:
 <p>3. Enter this command is your code block and press run:&nbsp;<em>cybergis.cancel_job()</em></p>
 
 <p>4. You should see a message displaying that your job has been canceled. Success!</p>"""
-            cancelExp = widgets.Accordion(children=(widgets.HTML(value=cancelText), ), selected_index=None)
-            cancelExp.set_title(0, "How to cancel a job")
-            display(cancelExp)
+            self.resultCancel['accordion'] = widgets.Accordion(children=(widgets.HTML(value=cancelText), ), selected_index=None)
+            self.resultCancel['accordion'].set_title(0, "How to cancel a job")
+        self.resultCancel['output'].append_display_data(
+            self.resultCancel['accordion'])
         return
 
     def renderResultEvents(self):
         """
         Display any events that occured while the job was being processed.
         """
-        if self.resultEvents['output'] is None:
-            self.resultEvents['output'] = widgets.Output()
         if not self.submitted:
             return
-        with self.resultEvents['output']:
-            self.compute.job.events()
+        # tailed like the logs: Job.events() blocks in a live loop
+        # and clears the screen, which is unusable off the comm thread
+        job = self.compute.job
+        if (self._eventPumpThread is not None and self._eventPumpThread.is_alive()):
+            if self._eventPumpJobId == job.id:
+                return
+            # a new job took over this panel; retire the old tail
+            self._eventPumpStop.set()
+        self._eventPumpJobId = job.id
+        self._eventPumpStop = threading.Event()
+        self._eventPumpThread = threading.Thread(
+            target=self._eventPump,
+            args=(self.resultEvents['output'], job, self._eventPumpStop),
+            daemon=True)
+        self._eventPumpThread.start()
         return
 
+    def _eventPump(self, output, job, stop):
+        """
+        Polls job events off the main thread, appending new rows to
+        the output widget until the job ends or the pump is stopped.
+        """
+        eventCount = 0
+        isEnd = False
+        idleIndex = 0
+        try:
+            while not isEnd and not stop.is_set():
+                status = job.status(raw=True)
+                events, isEnd = job._collect_events(status)
+                for eventType, message, createdAt in events[eventCount:]:
+                    output.append_stdout(
+                        str(eventType) + ': ' + str(message) + ' (' + str(createdAt) + ')\n')
+                if len(events) > eventCount:
+                    eventCount = len(events)
+                    idleIndex = 0
+                else:
+                    idleIndex += 1
+                if not isEnd:
+                    stop.wait(job._backoff(idleIndex, 0.5, 15, 1.5))
+        except Exception as e:
+            if not stop.is_set():
+                output.append_stdout(
+                    '❌ event tail stopped: ' + str(e) + '\n')
+
     def renderResultLogs(self):
         """
         Display when the job is finished and
         rerender the download section when it is.
         """
-        if self.resultLogs['output'] is None:
-            self.resultLogs['output'] = widgets.Output()
         if not self.submitted:
             return
-        with self.resultLogs['output']:
-            self.compute.job.logs()
-            self.tab.set_title(2, '✅ Download Job Result')
-            display(Markdown('***'))
-            display(Markdown('## ✅ your job completed'))
-            self.jobFinished = True
-            self.rerender(['download'])
+        # tail the logs in a background thread so the main comm thread
+        # stays responsive while the job runs; one pump per job
+        job = self.compute.job
+        if (self._logPumpThread is not None and self._logPumpThread.is_alive()):
+            if self._logPumpJobId == job.id:
+                return
+            # a new job took over this panel; retire the old tail
+            self._logPumpStop.set()
+        self._logPumpJobId = job.id
+        self._logPumpStop = threading.Event()
+        self._logPumpThread = threading.Thread(
+            target=self._logPump,
+            args=(self.resultLogs['output'], job, self._logPumpStop),
+            daemon=True)
+        self._logPumpThread.start()
         return
 
+    def _logPump(self, output, job, stop):
+        """
+        Polls job logs off the main thread, appending new rows to the
+        output widget (append_stdout is thread-safe), then flips the UI
+        to its finished state once the job ends. A stopped pump exits
+        without touching the UI, since another job owns it by then.
+        """
+        logCount = 0
+        isEnd = False
+        idleIndex = 0
+        try:
+            while not isEnd and not stop.is_set():
+                status = job.status(raw=True)
+                logs, isEnd = job._collect_logs(status)
+                for message, createdAt in logs[logCount:]:
+                    output.append_stdout(
+                        str(message) + ' (' + str(createdAt) + ')\n')
+                if len(logs) > logCount:
+                    logCount = len(logs)
+                    idleIndex = 0
+                else:
+                    idleIndex += 1
+                if not isEnd:
+                    stop.wait(job._backoff(idleIndex, 0.5, 15, 1.5))
+        except Exception as e:
+            if not stop.is_set():
+                output.append_stdout('❌ log tail stopped: ' + str(e) + '\n')
+            return
+        if stop.is_set():
+            return
+        self.tab.set_title(2, '✅ Download Job Result')
+        output.append_display_data(Markdown('***'))
+        output.append_display_data(Markdown('## ✅ your job completed'))
+        self.jobFinished = True
+        # the freshly finished job has its own result folder
+        self._resultFolderCache = None
+        # renderDownload captures into its output widget, which is not
+        # safe from this thread; as with the jobs tab, mark the
+        # download tab stale so its next selection rebuilds it on the
+        # comm thread
+        self._builtTabs.discard(2)
+
     def renderFolders(self):
         """
         Display a user's folders with ability to download and rename them
         """
         folders = self.compute.client.request('GET', '/folder', {'jupyterhubApiToken': self.compute.jupyterhubApiToken})
-        if self.folders['output'] is None:
-            self.folders['output'] = widgets.Output()
-        with self.folders['output']:
-            display(Markdown("We will do our best to keep this data for 90 days, but cannot guarantee it won’t be deleted sooner."))
-            display(Markdown("Please note that the renaming feature only allows for names made up of letters, numbers, and the characters ' . ' and ' _ '. Other characters will be removed from your input."))
-            pageNum = self.folderPage
-            numFolders = self.foldersPerPage
-            firstFolder = pageNum * numFolders
-            lastFolder = firstFolder + numFolders
-            if (lastFolder >= len(folders["folder"])):
-                lastFolder = len(folders["folder"])
-            display(Markdown('<br> **Showing folders ' + str(firstFolder + 1) + ' to ' + str(lastFolder) + ' of ' + str(len(folders["folder"])) + ' for ' + self.compute.username.split('@', 1)[0] + '**'))
+        # build everything first, then display in one pass, so the
+        # frontend receives the page as a burst instead of widget
+        # construction interleaved with comm messages
+        total = len(folders["folder"])
+        # cached so the next-page handler can check the bound without
+        # carrying it in a closure built at render time
+        self.folders['total'] = total
+        pageNum = self.folderPage
+        numFolders = self.foldersPerPage
+        firstFolder = pageNum * numFolders
+        lastFolder = firstFolder + numFolders
+        if (lastFolder >= total):
+            lastFolder = total
+        # the navigation buttons never change between renders, so
+        # build them once; like the per-folder widgets, a fresh pair
+        # per page flip would leak frontend models
+        if self.folders.get('page_buttons') is None:
             backButton = widgets.Button(description="Previous Page")
             nextButton = widgets.Button(description="Next Page")
-            pageButtons = widgets.HBox([backButton, nextButton])
             backButton.on_click(self.onPrevPageButton())
-            nextButton.on_click(self.onNextPageButton(len(folders["folder"])))
-            display(pageButtons)
-            listNames = []
-            for i in folders["folder"]:
-                if i['name'] is not None:
-                    listNames.append(i['name'])
-            listNames = [*set(listNames)]
-            for i in list(reversed(folders["folder"]))[firstFolder:lastFolder]:
-                headers = ['id', 'name', 'hpc', 'userId', 'isWritable', 'createdAt', 'updatedAt', 'deletedAt']
-                data = [[]]
-                for j in headers:
-                    data[0].append(i[j])
-                display(Markdown(MarkdownTable.render(data, headers)))
+            nextButton.on_click(self.onNextPageButton())
+            self.folders['page_buttons'] = widgets.HBox(
+                [backButton, nextButton])
+        pageButtons = self.folders['page_buttons']
+        # deduped name suggestions only change on rename, so reuse
+        # them between page flips; a tuple also lets the Combobox
+        # skip a defensive copy of its options
+        if self.folders.get('name_cache') is None:
+            self.folders['name_cache'] = tuple(dict.fromkeys(
+                i['name'] for i in folders["folder"]
+                if i['name'] is not None))
+        listNames = self.folders['name_cache']
+        showing = Markdown('<br> **Showing folders ' + str(firstFolder + 1) + ' to ' + str(lastFolder) + ' of ' + str(total) + '**')
+        items = [
+            Markdown("We will do our best to keep this data for 90 days, but cannot guarantee it won’t be deleted sooner."),
+            Markdown("Please note that the renaming feature only allows for names made up of letters, numbers, and the characters ' . ' and ' _ '. Other characters will be removed from your input."),
+            Markdown('<br> **Showing folders ' + str(firstFolder + 1) + ' to ' + str(lastFolder) + ' of ' + str(total) + ' for ' + self.compute.username.split('@', 1)[0] + '**'),
+            pageButtons]
+        # slice the page straight out of the list with index math
+        # instead of reversing every folder on each page flip
+        # one table for the whole page instead of a one-row table and
+        # its own comm message per folder; the action rows follow as a
+        # single VBox, each labeled with its folder
+        headers = ['id', 'name', 'hpc', 'userId', 'isWritable', 'createdAt', 'updatedAt', 'deletedAt']
+        data = []
+        actionRows = []
+        for i in folders["folder"][total - lastFolder:max(total - firstFolder, 0)][::-1]:
+            data.append([i[j] for j in headers])
+            # handlers are bound once per folder id, so they resolve
+            # the folder dict through this map at click time instead
+            # of closing over whatever this render happened to fetch
+            self.folders['data'][i['id']] = i
+            # widgets are created once per folder id and mutated on
+            # later renders; each new widget is a comm endpoint on the
+            # frontend, so rebuilding them every page flip leaks memory
+            if i['id'] not in self.folders['button']:
                 self.folders['button'][i['id']] = widgets.Button(description="Download Results")
-                display(self.folders['button'][i['id']])
-                self.folders['button'][i['id']].on_click(self.onFolderDownloadButtonClick(i))
-                """ Renaming UI """
+                self.folders['button'][i['id']].on_click(self.onFolderDownloadButtonClick(i['id']))
+            """ Renaming UI """
+            if i['id'] not in self.folders['rename']:
+                label = widgets.Label()
                 renameButton = widgets.Button(description="Rename Job")
                 nameSelect = widgets.Combobox(placeholder='Select new name', options=listNames, description='Enter Name:', ensure_option=False, disabled=False)
-                renameWidgets = widgets.HBox([renameButton, nameSelect])
-                renameButton.on_click(self.onRenameJobButton(i, nameSelect))
-                nameSelect.on_submit(self.onRenameJobButton(i, nameSelect))
-                display(renameWidgets)
-            display(Markdown('<br> **Showing folders ' + str(firstFolder + 1) + ' to ' + str(lastFolder) + ' of ' + str(len(folders["folder"])) + '**'))
-            display(pageButtons)
+                renameButton.on_click(self.onRenameJobButton(i['id'], nameSelect))
+                nameSelect.on_submit(self.onRenameJobButton(i['id'], nameSelect))
+                self.folders['rename'][i['id']] = (label, renameButton, nameSelect)
+            label, renameButton, nameSelect = self.folders['rename'][i['id']]
+            label.value = str(i['name'] if i['name'] is not None else i['id'])
+            nameSelect.options = listNames
+            # the row container is cached with its widgets: a new HBox
+            # per render would leak a frontend model per folder per
+            # page flip
+            if i['id'] not in self.folders['row']:
+                self.folders['row'][i['id']] = widgets.HBox([
+                    label, self.folders['button'][i['id']],
+                    renameButton, nameSelect])
+            actionRows.append(self.folders['row'][i['id']])
+        # folders deleted server-side leave dead widgets behind; close
+        # them so the frontend can free their models
+        liveIds = set()
+        for i in folders["folder"]:
+            liveIds.add(i['id'])
+        for folderId in list(self.folders['button']):
+            if folderId not in liveIds:
+                self.folders['button'].pop(folderId).close()
+        for folderId in list(self.folders['rename']):
+            if folderId not in liveIds:
+                for w in self.folders['rename'].pop(folderId):
+                    w.close()
+        for folderId in list(self.folders['row']):
+            if folderId not in liveIds:
+                self.folders['row'].pop(folderId).close()
+        for folderId in list(self.folders['data']):
+            if folderId not in liveIds:
+                del self.folders['data'][folderId]
+        if len(data) > 0:
+            items.append(Markdown(MarkdownTable.render(data, headers)))
+            # one reused VBox whose children are swapped per render
+            if self.folders.get('rows_box') is None:
+                self.folders['rows_box'] = widgets.VBox()
+            self.folders['rows_box'].children = tuple(actionRows)
+            items.append(self.folders['rows_box'])
+        items.append(showing)
+        items.append(pageButtons)
+        with self.folders['output']:
+            display(*items)
 
     def renderRecentlySubmittedJobs(self):
         """
         Display the jobs most recently submitted by the logged in user, allows user to restore these jobs.
         """
-        if self.recently_submitted['output'] is None:
-            self.recently_submitted['output'] = widgets.Output()
-            jobs = self.compute.client.request('GET', '/user/job', {'jupyterhubApiToken': self.compute.jupyterhubApiToken})
         with self.recently_submitted['output']:
             display(Markdown('**Recently Submitted Jobs for ' + self.compute.username.split('@', 1)[0] + '**'))
             jobs = self.compute.client.request('GET', '/user/job', {'jupyterhubApiToken': self.compute.jupyterhubApiToken})
             if len(jobs['job']) < self.recently_submitted['job_list_size']:
                 self.recently_submitted['job_list_size'] = len(jobs['job'])
-            for i in range(len(jobs['job']) - 1, len(jobs['job']) - self.recently_submitted['job_list_size'] - 1, -1):
-                job = self.compute.get_job_by_id(jobs['job'][i]['id'], verbose=False)
-                jobDetails = jobs['job'][i]
+            shown = [
+                jobs['job'][i] for i in range(
+                    len(jobs['job']) - 1,
+                    len(jobs['job']) - self.recently_submitted['job_list_size'] - 1,
+                    -1)]
+            # job objects never change once created, so keep them
+            # cached by id and only fetch the ones not seen before,
+            # in parallel instead of one round trip per job
+            cache = self.recently_submitted['cache']
+            missing = [i['id'] for i in shown if i['id'] not in cache]
+            if len(missing) > 0:
+                with ThreadPoolExecutor(
+                        max_workers=min(8, len(missing))) as executor:
+                    fetched = executor.map(
+                        lambda jobId: self.compute.get_job_by_id(
+                            jobId, verbose=False), missing)
+                    for jobId, job in zip(missing, fetched):
+                        cache[jobId] = job
+            for jobDetails in shown:
+                job = cache[jobDetails['id']]
                 job._print_job_formatted(jobDetails)
                 if self.refreshing:
-                    self.recently_submitted['submit'][jobs['job'][i]['id']] = widgets.Button(description="🔁 Loading", disabled=True)
+                    self.recently_submitted['submit'][jobDetails['id']] = widgets.Button(description="🔁 Loading", disabled=True)
                 else:
-                    self.recently_submitted['submit'][jobs['job'][i]['id']] = widgets.Button(description="Restore")
+                    self.recently_submitted['submit'][jobDetails['id']] = widgets.Button(description="Restore")
                 display(self.recently_submitted['submit'][jobDetails['id']])
                 display(Markdown("<br>"))
         for i in self.recently_submitted['submit'].keys():
@@ -646,9 +936,6 @@ class UI:
         """
         Renders a button to load more recently submitted jobs.
         """
-        if self.load_more['output'] is None:
-            self.load_more['output'] = widgets.Output()
-            self.load_more['load_more'] = widgets.Button(description="Load More")
         with self.load_more['output']:
             if self.refreshing:
                 self.load_more['load_more'] = widgets.Button(description="🔁 Loading", disabled=True)
@@ -657,6 +944,30 @@ class UI:
             display(self.load_more['load_more'])
         self.load_more['load_more'].on_click(self.onLoadMoreClick())
 
+    def _refreshJobsPanel(self, showLoading):
+        """
+        One-stop refresh of the recently-submitted panel and its
+        load-more button. With showLoading the existing buttons are
+        flipped to a disabled loading state in place — no refetch, no
+        rebuild; without it the panel is rebuilt from one fresh fetch.
+
+        Args:
+            showLoading (bool): whether to show the loading state
+        """
+        self.refreshing = showLoading
+        if showLoading:
+            for button in self.recently_submitted['submit'].values():
+                button.description = '🔁 Loading'
+                button.disabled = True
+            if self.load_more['load_more'] is not None:
+                self.load_more['load_more'].description = '🔁 Loading'
+                self.load_more['load_more'].disabled = True
+            return
+        self.recently_submitted['output'].clear_output()
+        self.load_more['output'].clear_output()
+        self.renderRecentlySubmittedJobs()
+        self.renderLoadMore()
+
     # events
     def onDownloadButtonClick(self):
         def on_click(change):
@@ -672,11 +983,10 @@ class UI:
                     return
 
             with self.download['result_output']:
-                self.refreshing = True
-                self.recently_submitted['output'].clear_output()
-                self.load_more['output'].clear_output()
-                self.renderRecentlySubmittedJobs()
-                self.renderLoadMore()
+                # flip existing buttons to their loading state in
+                # place; the single rebuild (and its /user/job fetch)
+                # happens once the download completes
+                self._refreshJobsPanel(True)
                 self.download['alert_output'].clear_output(wait=True)
                 self.downloading = True
                 localEndpoint = self.jupyter_globus['endpoint']
@@ -690,17 +1000,19 @@ class UI:
                 print('please check your data at your root folder under "' + filename + '"')
                 self.compute.recentDownloadPath = os.path.join(self.jupyter_globus['container_home_path'], filename)
                 self.downloading = False
-                self.refreshing = False
-                self.recently_submitted['output'].clear_output()
-                self.load_more['output'].clear_output()
-                self.renderRecentlySubmittedJobs()
-                self.renderLoadMore()
+                self._refreshJobsPanel(False)
 
         return on_click
 
     def onSubmitNewButtonClick(self):
         def on_click(change):
             self.submitted = False
+            # retire the previous job's tails before clearing, or they
+            # would keep appending its rows to the reset panels
+            if self._eventPumpStop is not None:
+                self._eventPumpStop.set()
+            if self._logPumpStop is not None:
+                self._logPumpStop.set()
             self.rerender(['resultStatus', 'resultEvents', 'resultLogs', 'submit'])
             self.submitNew['output'].clear_output()
             self.tab.set_title(2, 'Download Job Result')
@@ -710,82 +1022,133 @@ class UI:
     def onSubmitButtonClick(self):
         def on_click(change):
             """
-            Submit the job, then rerender the result status,
-            result events, result logs, and submit button.
+            Acknowledge the click immediately, then run the
+            submission in a background thread so the kernel stays
+            responsive for the duration.
             """
             if self.submitted:
                 return
-            with self.submit['alert_output']:
-                clear_output(wait=True)
-
-            self.compute.login()
-            localDataFolder = None
-            data = self.get_data()
-            if data['computing_resource'] != 'local_hpc':
-                self.jupyter_globus = self.compute.get_user_jupyter_globus()
-            if self.job['require_upload_data']:
-                dataPath = self.uploadData['selector'].selected
-                if dataPath is None:
-                    with self.submit['alert_output']:
-                        display(Markdown('⚠️ please select a folder before upload...'))
-                        return
-                else:
-                    dataPath = dataPath.replace(self.jupyter_globus['container_home_path'].strip('/'), '')
-                    dataPath = os.path.join(self.jupyter_globus['root_path'], dataPath.strip('/'))
-                    localDataFolder = {
-                        'type': 'globus',
-                        'endpoint': self.jupyter_globus['endpoint'],
-                        'path': dataPath
-                    }
-            try:
-                self.compute.job = self.compute.create_job(hpc=data['computing_resource'], verbose=False)
-            except Exception as e:
-                print("There was an exception while submitting the job: " + str(e))
-                if "Not authorized for HPC" in str(e):  # TODO: we should create a specific exception rather than checking the message
-                    with self.submit['alert_output']:
-                        display(Markdown("<b><font color='red'>You are not authorized to submit jobs to this HPC (" + str(data['computing_resource']) + "). Please try another HPC or contact the CyberGIS-Compute team.</b>"""))
-                else:  # generic error
-                    with self.submit['alert_output']:
-                        display(Markdown("<b><font color='red'>There was an exception while submitting the job: " + str(e) + "</b>"))
+            if (self._submitThread is not None and self._submitThread.is_alive()):
                 return
-            # slurm
-            slurm = data['slurm']
-            if data['email'] is not None:
-                slurm['mail_user'] = [data['email']]
-                slurm['mail_type'] = ['FAIL', 'END', 'BEGIN']
-            # param
-            param = data['param']
-            # download
-            self.globus_filename = 'globus_download_' + self.compute.job.id
-            # executable
-            localExecutableFolder = {
-                'type': 'git',
-                'gitId': data['job_template']
-            }
-
-            # submit
-            self.compute.job.set(localExecutableFolder=localExecutableFolder, localDataFolder=localDataFolder, printJob=False, param=param, slurm=slurm)
-            self.compute.job.submit()
-            self.tab.selected_index = 1
-            self.submitted = True
-            self.tab.set_title(1, '⏳ Your Job Status')
-            self.rerender(['resultStatus', 'resultEvents', 'resultLogs', 'submit'])
-            self.recently_submitted['output'].clear_output()
-            self.load_more['output'].clear_output()
-            self.submitNew['output'].clear_output()
-            self.renderRecentlySubmittedJobs()
-            self.renderSubmitNew()
-            """ If the user has indicated the job should be named and provided a name, the produced files are named here """
-            if data['name'] is not None and data['name'] != "":
-                nameForFile = self.makeNameSafe(data['name'])
-                jobs = self.compute.client.request('GET', '/user/job', {'jupyterhubApiToken': self.compute.jupyterhubApiToken})
-                job = jobs['job'][len(jobs['job']) - 1]
-                useFolder = job['remoteExecutableFolder']['id']
-                self.compute.client.request('PUT', '/folder/' + useFolder, {'jupyterhubApiToken': self.compute.jupyterhubApiToken, 'name': nameForFile + '_executable'})
-                useFolder = job['remoteResultFolder']['id']
-                self.compute.client.request('PUT', '/folder/' + useFolder, {'jupyterhubApiToken': self.compute.jupyterhubApiToken, 'name': nameForFile + '_result'})
+            self.submit['button'].description = '⏳ Submitting...'
+            self.submit['button'].disabled = True
+            self._submitThread = threading.Thread(
+                target=self._doSubmit, daemon=True)
+            self._submitThread.start()
         return on_click
 
+    def _doSubmit(self):
+        """
+        Submit the job, then rerender the result status,
+        result events, result logs, and submit button. Runs in a
+        background thread; failure paths re-enable the submit button.
+        """
+        try:
+            self._submit()
+        except Exception as e:
+            self.submit['alert_output'].append_display_data(
+                Markdown("<b><font color='red'>There was an exception while submitting the job: " + str(e) + "</b>"))
+        if not self.submitted:
+            self.submit['button'].description = 'Submit Job'
+            self.submit['button'].disabled = False
+
+    def _submit(self):
+        """
+        The submission itself: login, upload data, create the job,
+        submit it, and flip the UI into its submitted state. Runs on
+        the submit thread, so all widget updates go through the
+        thread-safe append/clear widget methods and trait writes —
+        output capture belongs to whatever cell last ran.
+        """
+        self.submit['alert_output'].clear_output(wait=True)
+
+        self.compute.login()
+        localDataFolder = None
+        data = self.get_data()
+        if data['computing_resource'] != 'local_hpc':
+            self.jupyter_globus = self.compute.get_user_jupyter_globus()
+        if self.job['require_upload_data']:
+            dataPath = self.uploadData['selector'].selected
+            if dataPath is None:
+                self.submit['alert_output'].append_display_data(
+                    Markdown('⚠️ please select a folder before upload...'))
+                return
+            else:
+                dataPath = dataPath.replace(self.jupyter_globus['container_home_path'].strip('/'), '')
+                dataPath = os.path.join(self.jupyter_globus['root_path'], dataPath.strip('/'))
+                localDataFolder = {
+                    'type': 'globus',
+                    'endpoint': self.jupyter_globus['endpoint'],
+                    'path': dataPath
+                }
+        try:
+            self.compute.job = self.compute.create_job(hpc=data['computing_resource'], verbose=False)
+        except Exception as e:
+            if "Not authorized for HPC" in str(e):  # TODO: we should create a specific exception rather than checking the message
+                self.submit['alert_output'].append_display_data(
+                    Markdown("<b><font color='red'>You are not authorized to submit jobs to this HPC (" + str(data['computing_resource']) + "). Please try another HPC or contact the CyberGIS-Compute team.</b>"""))
+            else:  # generic error
+                self.submit['alert_output'].append_display_data(
+                    Markdown("<b><font color='red'>There was an exception while submitting the job: " + str(e) + "</b>"))
+            return
+        # slurm
+        slurm = data['slurm']
+        if data['email'] is not None:
+            slurm['mail_user'] = [data['email']]
+            slurm['mail_type'] = ['FAIL', 'END', 'BEGIN']
+        # param
+        param = data['param']
+        # download
+        self.globus_filename = 'globus_download_' + self.compute.job.id
+        # executable
+        localExecutableFolder = {
+            'type': 'git',
+            'gitId': data['job_template']
+        }
+
+        # submit
+        self.compute.job.set(localExecutableFolder=localExecutableFolder, localDataFolder=localDataFolder, printJob=False, param=param, slurm=slurm)
+        self.compute.job.submit()
+        self.submitted = True
+        self.tab.set_title(1, '⏳ Your Job Status')
+        # selecting the tab fires onTabSelected synchronously; mark it
+        # built first so _populateTab does not start the pumps before
+        # the rerender below clears the panels and loses their rows
+        self._builtTabs.add(1)
+        self.tab.selected_index = 1
+        # the status renderer appends and the events/logs renderers
+        # hand off to pump threads, so rerendering them here is safe
+        self.rerender(['resultStatus', 'resultEvents', 'resultLogs'])
+        # flip the submit button in place instead of rerendering its
+        # section, and hand the user the submit-new button by append
+        self.submit['button'].description = 'Job Submitted ✅'
+        self.submit['button'].disabled = True
+        self.submitNew['output'].clear_output()
+        self.submitNew['button'] = widgets.Button(description="Submit New Job")
+        self.submitNew['button'].on_click(self.onSubmitNewButtonClick())
+        self.submitNew['output'].append_display_data(self.submitNew['button'])
+        # the jobs tab is lazily built; mark it stale so its next
+        # selection rebuilds it on the comm thread
+        self._builtTabs.discard(3)
+        self.recently_submitted['output'].clear_output()
+        self.load_more['output'].clear_output()
+        """ If the user has indicated the job should be named and provided a name, the produced files are named here """
+        if data['name'] is not None and data['name'] != "":
+            nameForFile = self.makeNameSafe(data['name'])
+            jobs = self.compute.client.request('GET', '/user/job', {'jupyterhubApiToken': self.compute.jupyterhubApiToken})
+            job = jobs['job'][len(jobs['job']) - 1]
+            # the two renames are independent, so issue them in
+            # parallel instead of paying two sequential round trips
+            renames = [
+                (job['remoteExecutableFolder']['id'], nameForFile + '_executable'),
+                (job['remoteResultFolder']['id'], nameForFile + '_result')]
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                list(executor.map(
+                    lambda rename: self.compute.client.request(
+                        'PUT', '/folder/' + rename[0],
+                        {'jupyterhubApiToken': self.compute.jupyterhubApiToken, 'name': rename[1]}),
+                    renames))
+
     def onJobDropdownChange(self):
         def on_change(change):
             """
@@ -801,6 +1164,8 @@ class UI:
                 self.job = self.jobs[self.jobName]
                 self.hpcName = self.job['default_hpc']
                 self.hpc = self.hpcs[self.hpcName]
+                self._slurmSignature = None
+                self._paramSignature = None
                 self.rerender(
                     [
                         'description', 'computingResource',
@@ -820,20 +1185,40 @@ class UI:
                     return
                 self.hpcName = self.computingResource['dropdown'].value
                 self.hpc = self.hpcs[self.hpcName]
+                self._slurmSignature = None
+                self._paramSignature = None
                 self.rerender(['description', 'slurm', 'param', 'uploadData'])
                 self.submit['alert_output'].clear_output()  # clear any errors from previous job
         return on_change
 
+    def _paginationDebounced(self):
+        """
+        Decides whether a pagination click should be dropped as the
+        queued second half of a double-click
+
+        Returns:
+            bool: True when the click arrived within the debounce
+            window of the last handled one
+        """
+        return time.monotonic() - self._paginationTs < self._paginationDebounce
+
     def onLoadMoreClick(self):
         def on_click(change):
             """
             Increase the number of recently submitted jobs being displayed by five and rerender teh recently subsmitted and load more attributes.
             """
-            self.recently_submitted['job_list_size'] += 5
-            self.recently_submitted['output'].clear_output()
-            self.load_more['output'].clear_output()
-            self.renderRecentlySubmittedJobs()
-            self.renderLoadMore()
+            if self._paginationDebounced():
+                return
+            change.disabled = True
+            try:
+                self.recently_submitted['job_list_size'] += 5
+                self.recently_submitted['output'].clear_output()
+                self.load_more['output'].clear_output()
+                self.renderRecentlySubmittedJobs()
+                self.renderLoadMore()
+            finally:
+                self._paginationTs = time.monotonic()
+                change.disabled = False
         return on_click
 
     def onJobEntryButtonClick(self, job_id):
@@ -845,6 +1230,9 @@ class UI:
             self.compute.job = job
             self.jupyter_globus = self.compute.get_user_jupyter_globus()
             self.globus_filename = 'globus_download_' + self.compute.job.id
+            # as in _submit: claim the tab before selecting it so the
+            # rerender below is the single render of these panels
+            self._builtTabs.add(1)
             self.tab.selected_index = 1
             self.submitted = True
             self.rerender(['resultStatus', 'resultEvents', 'resultLogs', 'submit', 'submitNew'])
@@ -855,8 +1243,11 @@ class UI:
             self.refreshing = False
         return on_click
 
-    def onFolderDownloadButtonClick(self, folder):
+    def onFolderDownloadButtonClick(self, folderId):
         def on_click(change):
+            # resolved at click time so a rename since the button was
+            # created is reflected in the download path
+            folder = self.folders['data'][folderId]
             jupyter_globus = self.compute.get_user_jupyter_globus()
             localEndpoint = jupyter_globus['endpoint']
             """ Tries using name, and if no name is provided downloads folder without name information """
@@ -872,30 +1263,59 @@ class UI:
             })
         return on_click
 
-    def onRenameJobButton(self, folder, wdgt):
+    def onRenameJobButton(self, folderId, wdgt):
         def on_click(change):
-            newName = self.makeNameSafe(wdgt.value)
-            self.compute.client.request('PUT', '/folder/' + folder["id"], {'jupyterhubApiToken': self.compute.jupyterhubApiToken, 'name': newName})
-            self.folders['output'].clear_output()
-            self.renderFolders()
+            if self._paginationDebounced():
+                return
+            try:
+                newName = self.makeNameSafe(wdgt.value)
+                self.compute.client.request('PUT', '/folder/' + folderId, {'jupyterhubApiToken': self.compute.jupyterhubApiToken, 'name': newName})
+                self.folders['name_cache'] = None
+                self.folders['output'].clear_output()
+                self.renderFolders()
+            finally:
+                self._paginationTs = time.monotonic()
         return on_click
 
     def onPrevPageButton(self):
         def on_click(change):
-            if (self.folderPage - 1 >= 0):
-                self.folderPage -= 1
-            self.folders['output'].clear_output()
-            self.renderFolders()
+            if self._paginationDebounced():
+                return
+            change.disabled = True
+            try:
+                if (self.folderPage - 1 >= 0):
+                    self.folderPage -= 1
+                self.folders['output'].clear_output()
+                self.renderFolders()
+            finally:
+                self._paginationTs = time.monotonic()
+                change.disabled = False
         return on_click
 
-    def onNextPageButton(self, totalJobs):
+    def onNextPageButton(self):
         def on_click(change):
-            if ((self.folderPage + 1) * self.foldersPerPage < totalJobs):
-                self.folderPage += 1
-            self.folders['output'].clear_output()
-            self.renderFolders()
+            if self._paginationDebounced():
+                return
+            change.disabled = True
+            try:
+                if ((self.folderPage + 1) * self.foldersPerPage < self.folders.get('total', 0)):
+                    self.folderPage += 1
+                self.folders['output'].clear_output()
+                self.renderFolders()
+            finally:
+                self._paginationTs = time.monotonic()
+                change.disabled = False
         return on_click
 
+    def onTabSelected(self):
+        def on_change(change):
+            """
+            Build a tab's contents the first time it is opened;
+            later selections reuse the already-rendered widgets.
+            """
+            self._populateTab(change['new'])
+        return on_change
+
     # helpers
     def init(self):
         """
@@ -904,8 +1324,19 @@ class UI:
         """
         self.compute.login()
 
-        self.jobs = self.compute.list_git(raw=True)
-        self.hpcs = self.compute.list_hpc(raw=True)
+        # kick off the announcements fetch early so it overlaps with
+        # the rest of the render instead of stalling it
+        self._announcementsFuture = self._executor.submit(
+            self.compute.client.request, 'GET', '/announcement')
+
+        now = time.monotonic()
+        if (self._catalogCache is not None and now - self._catalogCache[0] < self._catalogCacheTTL):
+            self.jobs = self._catalogCache[1]
+            self.hpcs = self._catalogCache[2]
+        else:
+            self.jobs = self.compute.list_git(raw=True)
+            self.hpcs = self.compute.list_hpc(raw=True)
+            self._catalogCache = (now, self.jobs, self.hpcs)
         # state
         self.submitted = False
         self.jobFinished = False
@@ -913,33 +1344,65 @@ class UI:
         self.refreshing = False
         self.folderPage = 0
         self.foldersPerPage = 10
-        # components
-        self.jobTemplate = {'output': None}
-        self.description = {'output': None}
-        self.computingResource = {'output': None}
-        self.slurm = {'output': None}
-        self.email = {'output': None}
-        self.name = {'output': None}
-        self.submit = {'output': None, 'alert_output': None}
-        self.submitNew = {'output': None, 'button': None}
-        self.param = {'output': None}
-        self.uploadData = {'output': None}
-        self.resultStatus = {'output': None}
-        self.resultCancel = {'output': None}
-        self.resultEvents = {'output': None}
-        self.resultLogs = {'output': None}
-        self.download = {'output': None, 'alert_output': None, 'result_output': None}
-        self.recently_submitted = {'output': None, 'submit': {}, 'job_list_size': 5, 'load_more': None}
-        self.load_more = {'output': None, 'load_more': None}
-        self.folders = {'output': None, 'button': {}}
+        # components: every Output is created here so the renderX
+        # methods never need to null-check, and lazily rendered tabs
+        # have placeholders the tab bar can assemble around
+        self.jobTemplate = {'output': widgets.Output()}
+        self.description = {'output': widgets.Output()}
+        self.computingResource = {'output': widgets.Output()}
+        self.slurm = {'output': widgets.Output()}
+        self.email = {'output': widgets.Output()}
+        self.name = {'output': widgets.Output()}
+        self.submit = {'output': widgets.Output(), 'alert_output': widgets.Output()}
+        self.submitNew = {'output': widgets.Output(), 'button': None}
+        self.param = {'output': widgets.Output()}
+        self.uploadData = {'output': widgets.Output()}
+        self.resultStatus = {'output': widgets.Output()}
+        self.resultCancel = {'output': widgets.Output()}
+        self.resultEvents = {'output': widgets.Output()}
+        self.resultLogs = {'output': widgets.Output()}
+        self.download = {'output': widgets.Output(), 'alert_output': widgets.Output(), 'result_output': widgets.Output()}
+        self.recently_submitted = {'output': widgets.Output(), 'submit': {}, 'cache': {}, 'job_list_size': 5, 'load_more': None}
+        self.load_more = {'output': widgets.Output(), 'load_more': None}
+        self.folders = {'output': widgets.Output(), 'button': {}, 'rename': {}, 'row': {}, 'data': {}}
         # main
         self.tab = None
+        # contents of non-initial tabs are built on first selection;
+        # each entry maps tab index -> (component attr, render method)
+        self._builtTabs = {0}
+        self._deferredTabs = {
+            1: (('resultStatus', 'renderResultStatus'),
+                ('resultCancel', 'renderResultCancel'),
+                ('resultEvents', 'renderResultEvents'),
+                ('resultLogs', 'renderResultLogs')),
+            2: (('download', 'renderDownload'),),
+            3: (('recently_submitted', 'renderRecentlySubmittedJobs'),
+                ('load_more', 'renderLoadMore')),
+            4: (('folders', 'renderFolders'),),
+        }
         # information
         self.jobName = self.defaultJobName
         self.job = self.jobs[self.jobName]
         self.hpcName = self.job['default_hpc']
         self.hpc = self.hpcs[self.hpcName]
 
+    def _populateTab(self, index):
+        """
+        Renders the contents of a lazily built tab the first time
+        it is selected
+
+        Args:
+            index (int): selected tab index
+        """
+        if index in self._builtTabs or index not in self._deferredTabs:
+            return
+        self._builtTabs.add(index)
+        for component, renderer in self._deferredTabs[index]:
+            output = getattr(self, component)['output']
+            if output is not None:
+                output.clear_output()
+            getattr(self, renderer)()
+
     def rerender(self, components=[]):
         """
         Clears and renders the specified components
@@ -956,8 +1419,7 @@ class UI:
 
     """ Used to ensure that folders have names with only safe characters """
     def makeNameSafe(self, text):
-        keepcharacters = ('.', '_')
-        return "".join(c for c in text if c.isalnum() or c in keepcharacters).rstrip()
+        return text.translate(self._SAFE_TABLE).rstrip()
 
     # data
     def get_data(self):
@@ -989,9 +1451,9 @@ class UI:
                 if not self.slurm[i].value:
                     continue  # skip null value
                 config = self.job['slurm_input_rules'][i]
-                if i in self.slurm_integer_storage_unit_config:
+                if i in self._slurm_integer_storage_unit_config:
                     out['slurm'][i] = str(self.slurm[i].value) + str(config['unit'])
-                elif i in self.slurm_integer_time_unit_config:
+                elif i in self._slurm_integer_time_unit_config:
                     seconds = self.unitTimeToSecond(config['unit'], self.slurm[i].value)
                     out['slurm'][i] = self.secondsToTime(seconds)
                 else:
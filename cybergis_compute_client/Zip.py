@@ -6,7 +6,11 @@ Example:
         zip = Zip()
 """
 
+import mmap
+import os
+import shutil
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 
 
@@ -20,10 +24,17 @@ class Zip(object):
     Attributes:
         in_memory_zip: A BytesIO in-memory file
     """
+    # files smaller than this are read directly; below this size
+    # the mmap setup costs more than it saves
+    mmap_threshold = 64 * 1024
+
     def __init__(self):
         """Inits Zip with in_memory_zip"""
         # Create the in-memory file-like object
         self.in_memory_zip = BytesIO()
+        # Shared write handle, kept open across appends and closed
+        # lazily when the archive is read back
+        self._zipfile = None
 
     def mkdir(self, filedir_in_zip):
         """
@@ -35,18 +46,15 @@ class Zip(object):
         Returns:
             Zip: this Zip
         """
-        # Get a handle to the in-memory zip in append mode
-        zf = zipfile.ZipFile(
-            self.in_memory_zip, "a", zipfile.ZIP_DEFLATED, False)
+        zf = self._handle()
 
         # Writes a directory to the in-memory zip
         zf.writestr(
             filedir_in_zip + '/.placeholder', "b", zipfile.ZIP_DEFLATED)
 
-        # Mark the files as having been created on Windows so that
-        # # Unix permissions are not inferred as 0000
-        for zfile in zf.filelist:
-            zfile.create_system = 0
+        # Mark the file as having been created on Windows so that
+        # Unix permissions are not inferred as 0000
+        zf.filelist[-1].create_system = 0
 
         return self
 
@@ -63,20 +71,112 @@ class Zip(object):
         Returns:
             Zip: this Zip
         """
-        # Get a handle to the in-memory zip in append mode
-        zf = zipfile.ZipFile(
-            self.in_memory_zip, "a", zipfile.ZIP_DEFLATED, False)
+        zf = self._handle()
 
         # Write the file to the in-memory zip
         zf.writestr(filename_in_zip, file_contents, zipfile.ZIP_DEFLATED)
 
-        # Mark the files as having been created on Windows so that
-        # # Unix permissions are not inferred as 0000
-        for zfile in zf.filelist:
-            zfile.create_system = 0
+        # Mark the file as having been created on Windows so that
+        # Unix permissions are not inferred as 0000
+        zf.filelist[-1].create_system = 0
 
         return self
 
+    def _handle(self):
+        """
+        Returns the shared write handle to the in-memory zip,
+        reopening it in append mode after a read closed it
+
+        Returns:
+            obj: ZipFile opened on in_memory_zip
+        """
+        if self._zipfile is None:
+            self._zipfile = zipfile.ZipFile(
+                self.in_memory_zip, "a", zipfile.ZIP_DEFLATED, False)
+        return self._zipfile
+
+    def _flush(self):
+        """
+        Closes the write handle so the central directory is
+        written out and the buffer holds a complete archive
+        """
+        if self._zipfile is not None:
+            self._zipfile.close()
+            self._zipfile = None
+
+    def append_folder(self, folder_path):
+        """
+        Appends every file under folder_path to the in-memory zip,
+        keeping paths relative to folder_path.
+
+        Files below mmap_threshold are read inline, where the executor
+        hand-off would cost more than the read itself; larger files are
+        memory-mapped concurrently through a thread pool so the OS pages
+        content on demand and the zip writer consumes a zero-copy
+        buffer. Symlinked directories are followed with cycle detection.
+
+        Args:
+            folder_path (str): Path of the folder that needs to be zipped
+
+        Returns:
+            Zip: this Zip
+        """
+        folder_path = os.path.abspath(folder_path)
+
+        def map_file(name, abspath):
+            with open(abspath, 'rb') as i:
+                return (name, mmap.mmap(
+                    i.fileno(), 0, access=mmap.ACCESS_READ))
+
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = []
+            for name, abspath, size in self._iter_files(folder_path):
+                if size < self.mmap_threshold:
+                    with open(abspath, 'rb') as i:
+                        self.append(name, i.read())
+                else:
+                    futures.append(executor.submit(map_file, name, abspath))
+            for future in futures:
+                name, contents = future.result()
+                self.append(name, contents)
+                contents.close()
+
+        return self
+
+    def _iter_files(self, folder_path):
+        """
+        Yields (relative path, absolute path, size) for every file
+        under folder_path.
+
+        Walks with os.scandir so the file type and stat information
+        cached from the directory read are reused instead of issuing a
+        stat() per entry. Directories already visited (by device/inode)
+        are skipped so symlink cycles terminate.
+
+        Args:
+            folder_path (str): Absolute path of the folder to walk
+        """
+        seen = set()
+        stack = [(folder_path, '')]
+        while stack:
+            current, rel = stack.pop()
+            stat = os.stat(current)
+            inode = (stat.st_dev, stat.st_ino)
+            if inode in seen:
+                continue
+            seen.add(inode)
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=True):
+                        stack.append(
+                            (entry.path, os.path.join(rel, entry.name)))
+                    elif entry.is_file(follow_symlinks=True):
+                        yield (
+                            os.path.join(rel, entry.name),
+                            entry.path,
+                            entry.stat().st_size)
+
     def read(self):
         """
         Reads the contents of the in-memory zip.
@@ -84,16 +184,19 @@ class Zip(object):
         Returns:
             str: contents of the in-memory zip
         """
+        self._flush()
         self.in_memory_zip.seek(0)
         return self.in_memory_zip.read()
 
     def write(self, filename):
         """
-        Writes the in-memory zip to a file
+        Writes the in-memory zip to a file, streaming in fixed-size
+        chunks instead of materializing the whole archive as bytes
 
         Args:
             filename(str): Name of the file that needs to be written
         """
-        f = open(filename, "wb")
-        f.write(self.read())
-        f.close()
+        self._flush()
+        self.in_memory_zip.seek(0)
+        with open(filename, "wb") as f:
+            shutil.copyfileobj(self.in_memory_zip, f, length=1 << 20)
@@ -23,6 +23,24 @@ def test_Zip():
     assert len(open('y','rb').read()) == len(zip.read())
     os.remove("y")
 
+"""
+Ensures folders are zipped recursively with paths relative to the folder
+"""
+def test_Zip_append_folder(tmp_path):
+    (tmp_path / 'sub').mkdir()
+    (tmp_path / 'a.txt').write_text('aaa')
+    (tmp_path / 'sub' / 'b.txt').write_text('bbb')
+    (tmp_path / 'big.bin').write_bytes(b'x' * (Zip.mmap_threshold + 1))
+    zip = Zip()
+    zip.append_folder(str(tmp_path))
+    import zipfile
+    from io import BytesIO
+    zf = zipfile.ZipFile(BytesIO(zip.read()))
+    assert sorted(zf.namelist()) == [
+        'a.txt', 'big.bin', os.path.join('sub', 'b.txt')]
+    assert zf.read('a.txt') == b'aaa'
+    assert zf.read('big.bin') == b'x' * (Zip.mmap_threshold + 1)
+
 """
 Confirms that without necessary information, socket exceptions occur
 """
@@ -61,3 +79,94 @@ def test_CyberGISCompute():
         community_Summa_Session.create_job()
     exception_raised = exc_info.value
     assert isinstance(exception_raised,socket.gaierror) 
+
+
+"""
+Confirms Retry-After parsing handles seconds, HTTP dates, and bad input
+"""
+def test_Client_retry_after_seconds():
+    class Response:
+        def __init__(self, retryAfter):
+            self.retryAfter = retryAfter
+        def getheader(self, name):
+            return self.retryAfter
+
+    client = Client(url='example.com')
+    assert client._retry_after_seconds(Response(None)) == 1
+    assert client._retry_after_seconds(Response('5')) == 5
+    assert client._retry_after_seconds(Response('120')) == 60
+    assert client._retry_after_seconds(Response('not a date')) == 1
+    from email.utils import format_datetime
+    from datetime import datetime, timedelta, timezone
+    date = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=10))
+    assert 0 < client._retry_after_seconds(Response(date)) <= 10
+
+"""
+Ensures only idempotent GETs are re-sent on 5xx or stale connections,
+while 429 is retried for every method
+"""
+def test_Client_request_retries(monkeypatch):
+    import cybergis_compute_client.Client as client_module
+    monkeypatch.setattr(client_module.time, 'sleep', lambda s: None)
+
+    class Response:
+        def __init__(self, status, body='{"ok": true}'):
+            self.status = status
+            self.will_close = False
+            self.body = body
+        def read(self):
+            return self.body.encode()
+        def getheader(self, name):
+            return None
+
+    class Connection:
+        def __init__(self, responses):
+            self.responses = responses
+            self.requests = 0
+        def request(self, *args):
+            self.requests += 1
+        def getresponse(self):
+            return self.responses.pop(0)
+        def close(self):
+            pass
+
+    client = Client(url='example.com')
+
+    # GET retries through a 500 to success
+    connection = Connection([Response(500), Response(200)])
+    client._local.connection = connection
+    assert client.request('GET', '/x') == {'ok': True}
+    assert connection.requests == 2
+
+    # POST never re-sends after a 500; the error is surfaced instead
+    connection = Connection([Response(500, '{"error": "boom"}')])
+    client._local.connection = connection
+    with pytest.raises(Exception):
+        client.request('POST', '/x')
+    assert connection.requests == 1
+
+    # 429 is safe to retry for every method
+    connection = Connection([Response(429, '{}'), Response(200)])
+    client._local.connection = connection
+    assert client.request('POST', '/x') == {'ok': True}
+    assert connection.requests == 2
+
+    # a stale reused connection is retried for GET...
+    class FlakyConnection(Connection):
+        def request(self, *args):
+            self.requests += 1
+            if self.requests == 1:
+                raise OSError('stale read')
+    connection = FlakyConnection([Response(200)])
+    client._local.connection = connection
+    monkeypatch.setattr(client, '_get_connection', lambda: connection)
+    assert client.request('GET', '/x') == {'ok': True}
+    assert connection.requests == 2
+
+    # ...but a POST that may have reached the server is not
+    connection = FlakyConnection([Response(200)])
+    client._local.connection = connection
+    monkeypatch.setattr(client, '_get_connection', lambda: connection)
+    with pytest.raises(OSError):
+        client.request('POST', '/x')
+    assert connection.requests == 1